@@ -1,6 +1,17 @@
 import os
+import threading
 import warnings
-from typing import Any, Callable, List, TYPE_CHECKING
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 import prefect
 from prefect import config
@@ -11,6 +22,240 @@ if TYPE_CHECKING:
     from prefect.core.flow import Flow  # pylint: disable=W0611
 
 
+# kwargs accepted by boto3's `register_task_definition` and `run_task` respectively
+_DEFINITION_KWARGS = frozenset(
+    {
+        "family",
+        "taskRoleArn",
+        "executionRoleArn",
+        "networkMode",
+        "containerDefinitions",
+        "volumes",
+        "placementConstraints",
+        "requiresCompatibilities",
+        "cpu",
+        "memory",
+        "tags",
+        "pidMode",
+        "ipcMode",
+        "proxyConfiguration",
+        "inferenceAccelerators",
+    }
+)
+
+_RUN_KWARGS = frozenset(
+    {
+        "cluster",
+        "taskDefinition",
+        "count",
+        "startedBy",
+        "group",
+        "placementConstraints",
+        "placementStrategy",
+        "platformVersion",
+        "networkConfiguration",
+        "tags",
+        "enableECSManagedTags",
+        "propagateTags",
+    }
+)
+
+# maps each accepted kwarg to whether it belongs to (register_task_definition, run_task)
+_KWARG_ROUTING = {
+    key: (key in _DEFINITION_KWARGS, key in _RUN_KWARGS)
+    for key in _DEFINITION_KWARGS | _RUN_KWARGS
+}  # type: Dict[str, Tuple[bool, bool]]
+
+# environment variables set on every container that do not depend on the loaded config
+_STATIC_ENV_VARS = {
+    "PREFECT__CLOUD__USE_LOCAL_SECRETS": "false",
+    "PREFECT__ENGINE__FLOW_RUNNER__DEFAULT_CLASS": "prefect.engine.cloud.CloudFlowRunner",
+    "PREFECT__ENGINE__TASK_RUNNER__DEFAULT_CLASS": "prefect.engine.cloud.CloudTaskRunner",
+    "PREFECT__LOGGING__LOG_TO_CLOUD": "true",
+}
+
+_FLOW_CONTAINER_COMMAND = (
+    "/bin/sh",
+    "-c",
+    "python -c 'import prefect; prefect.environments.FargateTaskEnvironment().run_flow()'",
+)
+
+_AWSCredentials = NamedTuple(
+    "_AWSCredentials",
+    [
+        ("aws_access_key_id", Optional[str]),
+        ("aws_secret_access_key", Optional[str]),
+        ("aws_session_token", Optional[str]),
+        ("region_name", Optional[str]),
+    ],
+)
+
+# environment variables used as fallbacks for each field of `_AWSCredentials`, in order
+_CREDENTIAL_ENV_VARS = (
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "AWS_SESSION_TOKEN",
+    "REGION_NAME",
+)
+
+
+def _resolve_aws_credentials(
+    aws_access_key_id: str = None,
+    aws_secret_access_key: str = None,
+    aws_session_token: str = None,
+    region_name: str = None,
+) -> _AWSCredentials:
+    """
+    Resolve AWS credentials, falling back to the environment for any value not provided.
+
+    Args:
+        - aws_access_key_id (str, optional): AWS access key id
+        - aws_secret_access_key (str, optional): AWS secret access key
+        - aws_session_token (str, optional): AWS session token
+        - region_name (str, optional): AWS region name
+
+    Returns:
+        - _AWSCredentials: the resolved credentials
+    """
+    provided = (
+        aws_access_key_id,
+        aws_secret_access_key,
+        aws_session_token,
+        region_name,
+    )
+    return _AWSCredentials(
+        *(
+            value or os.environ.get(env_var)
+            for value, env_var in zip(provided, _CREDENTIAL_ENV_VARS)
+        )
+    )
+
+
+# boto3 clients are thread-safe once constructed, so a single ECS client is shared
+# per set of credentials instead of paying the construction cost on every call
+_CLIENT_CACHE = {}  # type: Dict[_AWSCredentials, Any]
+_CLIENT_LOCK = threading.Lock()
+
+# keep connections to the ECS endpoint alive and pooled so repeated calls can skip the
+# TLS handshake, and let botocore back off on throttling instead of failing outright
+_BOTOCORE_CONFIG_KWARGS = {
+    "max_pool_connections": 50,
+    "retries": {"max_attempts": 10, "mode": "adaptive"},
+}  # type: Dict[str, Any]
+
+# boto3 and the botocore config are loaded on first use and then shared, since they are
+# optional dependencies that only need to be present when talking to AWS
+_boto3 = None
+_botocore_exceptions = None
+_botocore_config = None
+_LOAD_LOCK = threading.Lock()
+
+
+def _get_boto3() -> Any:
+    """
+    Import and return the `boto3` module, loading it only once per process.
+
+    Returns:
+        - module: the `boto3` module
+    """
+    global _boto3
+    if _boto3 is None:
+        with _LOAD_LOCK:
+            if _boto3 is None:
+                import boto3
+
+                _boto3 = boto3
+    return _boto3
+
+
+def _get_botocore_exceptions() -> Any:
+    """
+    Import and return the `botocore.exceptions` module, loading it only once per process.
+
+    Returns:
+        - module: the `botocore.exceptions` module
+    """
+    global _botocore_exceptions
+    if _botocore_exceptions is None:
+        with _LOAD_LOCK:
+            if _botocore_exceptions is None:
+                import botocore.exceptions
+
+                _botocore_exceptions = botocore.exceptions
+    return _botocore_exceptions
+
+
+def _build_botocore_config() -> Any:
+    """
+    Build the botocore `Config` for ECS clients, dropping any settings that the
+    installed version of botocore does not support. Only called once, while holding
+    `_LOAD_LOCK`, so it imports botocore directly.
+
+    Returns:
+        - Config: a botocore client config
+    """
+    from botocore.config import Config
+    from botocore.exceptions import InvalidRetryConfigurationError
+
+    try:
+        return Config(tcp_keepalive=True, **_BOTOCORE_CONFIG_KWARGS)
+    except TypeError:
+        # `tcp_keepalive` is not supported by older versions of botocore
+        pass
+
+    try:
+        return Config(**_BOTOCORE_CONFIG_KWARGS)
+    except InvalidRetryConfigurationError:
+        # retry modes are only supported from botocore 1.15 onward
+        retries = {
+            key: value
+            for key, value in _BOTOCORE_CONFIG_KWARGS["retries"].items()
+            if key != "mode"
+        }
+        return Config(**{**_BOTOCORE_CONFIG_KWARGS, "retries": retries})
+
+
+def _get_botocore_config() -> Any:
+    """
+    Return the botocore `Config` shared by all ECS clients, building it on first use.
+
+    Returns:
+        - Config: a botocore client config
+    """
+    global _botocore_config
+    if _botocore_config is None:
+        with _LOAD_LOCK:
+            if _botocore_config is None:
+                _botocore_config = _build_botocore_config()
+    return _botocore_config
+
+
+def _get_ecs_client(credentials: _AWSCredentials) -> Any:
+    """
+    Return a cached boto3 ECS client for the given credentials, creating it on first use.
+
+    Args:
+        - credentials (_AWSCredentials): the AWS credentials and region for the client
+
+    Returns:
+        - Client: a boto3 ECS client
+    """
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(credentials)
+        if client is None:
+            # an explicit session avoids racing on boto3's global default session
+            # see https://boto3.amazonaws.com/v1/documentation/api/latest/guide/resources.html?#multithreading-multiprocessing
+            session = _get_boto3().session.Session(**credentials._asdict())
+            client = session.client("ecs", config=_get_botocore_config())
+            _CLIENT_CACHE[credentials] = client
+    return client
+
+
+# task definition families known to exist, keyed on the credentials used to look them up
+_REGISTERED_FAMILIES = set()  # type: Set[Tuple[_AWSCredentials, Optional[str]]]
+_REGISTERED_FAMILIES_LOCK = threading.Lock()
+
+
 class FargateTaskEnvironment(Environment):
     """
     FargateTaskEnvironment is an environment which deploys your flow as a Fargate task.
@@ -74,7 +319,8 @@ class FargateTaskEnvironment(Environment):
         - on_exit (Callable, optional): a function callback which will be called after the flow finishes its run
         - metadata (dict, optional): extra metadata to be set and serialized on this environment
         - **kwargs (dict, optional): additional keyword arguments to pass to boto3 for
-            `register_task_definition` and `run_task`
+            `register_task_definition` and `run_task`; a `TypeError` is raised for any
+            kwarg that neither call accepts
     """
 
     def __init__(  # type: ignore
@@ -94,12 +340,14 @@ class FargateTaskEnvironment(Environment):
     ) -> None:
         self.launch_type = launch_type
         # Not serialized, only stored on the object
-        self.aws_access_key_id = aws_access_key_id or os.getenv("AWS_ACCESS_KEY_ID")
-        self.aws_secret_access_key = aws_secret_access_key or os.getenv(
-            "AWS_SECRET_ACCESS_KEY"
+        (
+            self.aws_access_key_id,
+            self.aws_secret_access_key,
+            self.aws_session_token,
+            self.region_name,
+        ) = _resolve_aws_credentials(
+            aws_access_key_id, aws_secret_access_key, aws_session_token, region_name
         )
-        self.aws_session_token = aws_session_token or os.getenv("AWS_SESSION_TOKEN")
-        self.region_name = region_name or os.getenv("REGION_NAME")
 
         # Parse accepted kwargs for definition and run
         self.task_definition_kwargs, self.task_run_kwargs = self._parse_kwargs(kwargs)
@@ -131,49 +379,28 @@ class FargateTaskEnvironment(Environment):
 
         Returns:
             tuple: a tuple of two dictionaries (task_definition_kwargs, task_run_kwargs)
-        """
-        definition_kwarg_list = [
-            "family",
-            "taskRoleArn",
-            "executionRoleArn",
-            "networkMode",
-            "containerDefinitions",
-            "volumes",
-            "placementConstraints",
-            "requiresCompatibilities",
-            "cpu",
-            "memory",
-            "tags",
-            "pidMode",
-            "ipcMode",
-            "proxyConfiguration",
-            "inferenceAccelerators",
-        ]
-
-        run_kwarg_list = [
-            "cluster",
-            "taskDefinition",
-            "count",
-            "startedBy",
-            "group",
-            "placementConstraints",
-            "placementStrategy",
-            "platformVersion",
-            "networkConfiguration",
-            "tags",
-            "enableECSManagedTags",
-            "propagateTags",
-        ]
 
+        Raises:
+            - TypeError: if any kwargs are not accepted by either boto3 call
+        """
         task_definition_kwargs = {}
-        for key, item in user_kwargs.items():
-            if key in definition_kwarg_list:
-                task_definition_kwargs.update({key: item})
-
         task_run_kwargs = {}
+        unknown_kwargs = []
         for key, item in user_kwargs.items():
-            if key in run_kwarg_list:
-                task_run_kwargs.update({key: item})
+            route = _KWARG_ROUTING.get(key)
+            if route is None:
+                unknown_kwargs.append(key)
+                continue
+            in_definition, in_run = route
+            if in_definition:
+                task_definition_kwargs[key] = item
+            if in_run:
+                task_run_kwargs[key] = item
+
+        if unknown_kwargs:
+            raise TypeError(
+                f"Unknown kwargs for FargateTaskEnvironment: {', '.join(sorted(unknown_kwargs))}"
+            )
 
         return task_definition_kwargs, task_run_kwargs
 
@@ -181,92 +408,90 @@ class FargateTaskEnvironment(Environment):
     def dependencies(self) -> list:
         return ["boto3", "botocore"]
 
+    @property
+    def _credentials(self) -> _AWSCredentials:
+        return _AWSCredentials(
+            self.aws_access_key_id,
+            self.aws_secret_access_key,
+            self.aws_session_token,
+            self.region_name,
+        )
+
+    def _boto3_client(self) -> Any:
+        """
+        Retrieve the shared boto3 ECS client for the credentials on this environment.
+
+        Returns:
+            - Client: a boto3 ECS client
+        """
+        return _get_ecs_client(self._credentials)
+
     def setup(self, flow: "Flow") -> None:  # type: ignore
         """
-        Register the task definition if it does not already exist.
+        Register the task definition if it does not already exist. Families that were
+        found or registered by this process are remembered and not looked up again.
 
         Args:
             - flow (Flow): the Flow object
         """
-        from boto3 import client as boto3_client
-        from botocore.exceptions import ClientError
-
-        boto3_c = boto3_client(
-            "ecs",
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key,
-            aws_session_token=self.aws_session_token,
-            region_name=self.region_name,
-        )
+        family = self.task_definition_kwargs.get("family")
+        registered_key = (self._credentials, family)
+        if family and registered_key in _REGISTERED_FAMILIES:
+            return
+
+        boto3_c = self._boto3_client()
 
         definition_exists = True
         try:
-            boto3_c.describe_task_definition(
-                taskDefinition=self.task_definition_kwargs.get("family")
-            )
-        except ClientError:
+            boto3_c.describe_task_definition(taskDefinition=family)
+        except _get_botocore_exceptions().ClientError as exc:
+            # ECS reports a missing task definition as a generic `ClientException`; any
+            # other error (e.g. credentials or throttling) should not trigger registration
+            error_code = exc.response.get("Error", {}).get("Code")
+            if error_code != "ClientException" and "not found" not in str(exc).lower():
+                raise
             definition_exists = False
 
         if not definition_exists:
-            env_values = [
-                {"name": "PREFECT__CLOUD__GRAPHQL", "value": config.cloud.graphql},
-                {"name": "PREFECT__CLOUD__USE_LOCAL_SECRETS", "value": "false"},
-                {
-                    "name": "PREFECT__ENGINE__FLOW_RUNNER__DEFAULT_CLASS",
-                    "value": "prefect.engine.cloud.CloudFlowRunner",
-                },
-                {
-                    "name": "PREFECT__ENGINE__TASK_RUNNER__DEFAULT_CLASS",
-                    "value": "prefect.engine.cloud.CloudTaskRunner",
-                },
-                {"name": "PREFECT__LOGGING__LOG_TO_CLOUD", "value": "true"},
-                {
-                    "name": "PREFECT__LOGGING__EXTRA_LOGGERS",
-                    "value": str(config.logging.extra_loggers),
-                },
+            flow_image = get_flow_image(flow)
+
+            env_vars = {
+                "PREFECT__CLOUD__GRAPHQL": config.cloud.graphql,
+                **_STATIC_ENV_VARS,
+                "PREFECT__LOGGING__EXTRA_LOGGERS": str(config.logging.extra_loggers),
+            }
+            env_entries = [
+                {"name": name, "value": value} for name, value in env_vars.items()
             ]
 
             # create containerDefinitions if they do not exist
             if not self.task_definition_kwargs.get("containerDefinitions"):
-                self.task_definition_kwargs["containerDefinitions"] = []
-                self.task_definition_kwargs["containerDefinitions"].append({})
-
-            # set environment variables for all containers
-            for definition in self.task_definition_kwargs["containerDefinitions"]:
-                if not definition.get("environment"):
-                    definition["environment"] = []
-                definition["environment"].extend(env_values)
-
-            # set name on first container
-            if not self.task_definition_kwargs["containerDefinitions"][0].get("name"):
-                self.task_definition_kwargs["containerDefinitions"][0]["name"] = ""
-
-            self.task_definition_kwargs.get("containerDefinitions")[0][
-                "name"
-            ] = "flow-container"
-
-            # set image on first container
-            if not self.task_definition_kwargs["containerDefinitions"][0].get("image"):
-                self.task_definition_kwargs["containerDefinitions"][0]["image"] = ""
-
-            self.task_definition_kwargs.get("containerDefinitions")[0][
-                "image"
-            ] = get_flow_image(flow)
-
-            # set command on first container
-            if not self.task_definition_kwargs["containerDefinitions"][0].get(
-                "command"
-            ):
-                self.task_definition_kwargs["containerDefinitions"][0]["command"] = []
-
-            self.task_definition_kwargs.get("containerDefinitions")[0]["command"] = [
-                "/bin/sh",
-                "-c",
-                "python -c 'import prefect; prefect.environments.FargateTaskEnvironment().run_flow()'",
-            ]
+                self.task_definition_kwargs["containerDefinitions"] = [{}]
+            containers = self.task_definition_kwargs["containerDefinitions"]
+
+            # set environment variables for all containers, replacing any user
+            # provided values for the same names so each is only defined once
+            for definition in containers:
+                environment = [
+                    env_var
+                    for env_var in definition.get("environment") or []
+                    if env_var.get("name") not in env_vars
+                ]
+                environment.extend(env_entries)
+                definition["environment"] = environment
+
+            # set name, image, and command on first container
+            first = containers[0]
+            first["name"] = "flow-container"
+            first["image"] = flow_image
+            first["command"] = list(_FLOW_CONTAINER_COMMAND)
 
             boto3_c.register_task_definition(**self.task_definition_kwargs)
 
+        if family:
+            with _REGISTERED_FAMILIES_LOCK:
+                _REGISTERED_FAMILIES.add(registered_key)
+
     def execute(  # type: ignore
         self, flow: "Flow", **kwargs: Any
     ) -> None:
@@ -277,9 +502,9 @@ class FargateTaskEnvironment(Environment):
             - flow (Flow): the Flow object
             - **kwargs (Any): additional keyword arguments to pass to the runner
         """
-        from boto3 import client as boto3_client
-
         flow_run_id = prefect.context.get("flow_run_id", "unknown")
+        flow_image = get_flow_image(flow)
+
         container_overrides = [
             {
                 "name": "flow-container",
@@ -290,19 +515,12 @@ class FargateTaskEnvironment(Environment):
                         or config.cloud.auth_token,
                     },
                     {"name": "PREFECT__CONTEXT__FLOW_RUN_ID", "value": flow_run_id},
-                    {"name": "PREFECT__CONTEXT__IMAGE", "value": get_flow_image(flow)},
+                    {"name": "PREFECT__CONTEXT__IMAGE", "value": flow_image},
                 ],
             }
         ]
 
-        boto3_c = boto3_client(
-            "ecs",
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key,
-            aws_session_token=self.aws_session_token,
-            region_name=self.region_name,
-        )
-
+        boto3_c = self._boto3_client()
         boto3_c.run_task(
             overrides={"containerOverrides": container_overrides},
             launchType=self.launch_type,
@@ -7,6 +7,7 @@ import prefect
 from prefect import Flow
 from prefect.engine.executors import LocalDaskExecutor
 from prefect.environments import FargateTaskEnvironment
+from prefect.environments.execution.fargate import fargate_task
 from prefect.environments.storage import Docker, Local
 from prefect.utilities.configuration import set_temporary_config
 from prefect.utilities.graphql import GraphQLResult
@@ -14,6 +15,36 @@ from prefect.utilities.graphql import GraphQLResult
 from botocore.exceptions import ClientError
 
 
+def missing_definition_error():
+    return ClientError(
+        {
+            "Error": {
+                "Code": "ClientException",
+                "Message": "Unable to describe task definition.",
+            }
+        },
+        "DescribeTaskDefinition",
+    )
+
+
+@pytest.fixture
+def ecs_client(monkeypatch):
+    client = MagicMock()
+    session = MagicMock()
+    session.return_value.client.return_value = client
+    monkeypatch.setattr("boto3.session.Session", session)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    fargate_task._CLIENT_CACHE.clear()
+    fargate_task._REGISTERED_FAMILIES.clear()
+    yield
+    fargate_task._CLIENT_CACHE.clear()
+    fargate_task._REGISTERED_FAMILIES.clear()
+
+
 def test_create_fargate_task_environment():
     environment = FargateTaskEnvironment()
     assert environment.executor is not None
@@ -91,6 +122,19 @@ def test_create_fargate_task_environment_aws_creds_environment(monkeypatch):
     assert environment.region_name == "region"
 
 
+def test_create_fargate_task_environment_aws_creds_mixed(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "env_id")
+    monkeypatch.setenv("REGION_NAME", "env_region")
+    monkeypatch.delenv("AWS_SECRET_ACCESS_KEY", raising=False)
+    monkeypatch.delenv("AWS_SESSION_TOKEN", raising=False)
+
+    environment = FargateTaskEnvironment(aws_access_key_id="id")
+    assert environment.aws_access_key_id == "id"
+    assert environment.aws_secret_access_key is None
+    assert environment.aws_session_token is None
+    assert environment.region_name == "env_region"
+
+
 def test_parse_task_definition_kwargs():
     environment = FargateTaskEnvironment()
 
@@ -212,34 +256,79 @@ def test_parse_task_definition_and_run_kwargs():
     assert task_run_kwargs == run_kwarg_dict
 
 
-def test_parse_task_kwargs_invalid_value_removed():
+def test_parse_task_kwargs_invalid_value_raises():
     environment = FargateTaskEnvironment()
 
-    kwarg_dict = {"test": "not_real"}
+    kwarg_dict = {"test": "not_real", "family": "test"}
+
+    with pytest.raises(TypeError, match="test"):
+        environment._parse_kwargs(kwarg_dict)
 
-    task_definition_kwargs, task_run_kwargs = environment._parse_kwargs(kwarg_dict)
 
-    assert task_definition_kwargs == {}
-    assert task_run_kwargs == {}
+def test_create_fargate_task_environment_invalid_kwarg_raises():
+    with pytest.raises(TypeError, match="taskDefinitionArn"):
+        FargateTaskEnvironment(taskDefinitionArn="test")
 
 
-def test_setup_definition_exists(monkeypatch):
-    boto3_client = MagicMock()
-    boto3_client.describe_task_definition.return_value = {}
-    monkeypatch.setattr("boto3.client", MagicMock(return_value=boto3_client))
+def test_setup_definition_exists(ecs_client):
+    ecs_client.describe_task_definition.return_value = {}
 
     environment = FargateTaskEnvironment()
 
     environment.setup(Docker(registry_url="test", image_name="image", image_tag="tag"))
 
-    assert boto3_client.describe_task_definition.called
+    assert ecs_client.describe_task_definition.called
+
+
+def test_boto3_client_is_cached_per_credentials(monkeypatch):
+    session = MagicMock()
+    monkeypatch.setattr("boto3.session.Session", session)
 
+    environment = FargateTaskEnvironment(region_name="region")
+    same_creds = FargateTaskEnvironment(region_name="region")
+    other_creds = FargateTaskEnvironment(region_name="other")
 
-def test_setup_definition_register(monkeypatch):
-    boto3_client = MagicMock()
-    boto3_client.describe_task_definition.side_effect = ClientError({}, None)
-    boto3_client.register_task_definition.return_value = {}
-    monkeypatch.setattr("boto3.client", MagicMock(return_value=boto3_client))
+    assert environment._boto3_client() is same_creds._boto3_client()
+    assert session.call_count == 1
+    assert session.return_value.client.call_args[0] == ("ecs",)
+
+    other_creds._boto3_client()
+    assert session.call_count == 2
+    assert session.call_args[1]["region_name"] == "other"
+
+
+def test_boto3_client_uses_keepalive_config(monkeypatch):
+    session = MagicMock()
+    monkeypatch.setattr("boto3.session.Session", session)
+
+    FargateTaskEnvironment()._boto3_client()
+
+    config = session.return_value.client.call_args[1]["config"]
+    assert config.tcp_keepalive is True
+    assert config.max_pool_connections == 50
+    assert config.retries == {"max_attempts": 10, "mode": "adaptive"}
+
+
+def test_botocore_config_falls_back_for_older_botocore(monkeypatch):
+    from botocore.exceptions import InvalidRetryConfigurationError
+
+    def old_config(retries, max_pool_connections):
+        if "mode" in retries:
+            raise InvalidRetryConfigurationError(
+                retry_config_option="mode", valid_options=["max_attempts"]
+            )
+        return MagicMock(retries=retries, max_pool_connections=max_pool_connections)
+
+    monkeypatch.setattr("botocore.config.Config", old_config)
+
+    config = fargate_task._build_botocore_config()
+    assert config.max_pool_connections == 50
+    assert config.retries == {"max_attempts": 10}
+
+
+def test_setup_definition_register(ecs_client):
+    ecs_client.describe_task_definition.side_effect = missing_definition_error()
+    ecs_client.register_task_definition.return_value = {}
 
     environment = FargateTaskEnvironment(
         family="test",
@@ -261,12 +350,10 @@ def test_setup_definition_register(monkeypatch):
         )
     )
 
-    assert boto3_client.describe_task_definition.called
-    assert boto3_client.register_task_definition.called
-    assert boto3_client.register_task_definition.call_args[1]["family"] == "test"
-    assert boto3_client.register_task_definition.call_args[1][
-        "containerDefinitions"
-    ] == [
+    assert ecs_client.describe_task_definition.called
+    assert ecs_client.register_task_definition.called
+    assert ecs_client.register_task_definition.call_args[1]["family"] == "test"
+    assert ecs_client.register_task_definition.call_args[1]["containerDefinitions"] == [
         {
             "name": "flow-container",
             "image": "test/image:tag",
@@ -297,11 +384,88 @@ def test_setup_definition_register(monkeypatch):
     ]
 
 
-def test_setup_definition_register_no_defintions(monkeypatch):
-    boto3_client = MagicMock()
-    boto3_client.describe_task_definition.side_effect = ClientError({}, None)
-    boto3_client.register_task_definition.return_value = {}
-    monkeypatch.setattr("boto3.client", MagicMock(return_value=boto3_client))
+def test_setup_definition_lookup_error_is_raised(ecs_client):
+    ecs_client.describe_task_definition.side_effect = ClientError(
+        {"Error": {"Code": "AccessDeniedException", "Message": "Access denied"}},
+        "DescribeTaskDefinition",
+    )
+
+    environment = FargateTaskEnvironment(family="test")
+
+    with pytest.raises(ClientError, match="AccessDeniedException"):
+        environment.setup(
+            Flow(
+                "name",
+                storage=Docker(
+                    registry_url="test", image_name="image", image_tag="tag"
+                ),
+            )
+        )
+
+    assert not ecs_client.register_task_definition.called
+    assert not fargate_task._REGISTERED_FAMILIES
+
+
+def test_setup_definition_register_replaces_duplicate_env_vars(ecs_client):
+    ecs_client.describe_task_definition.side_effect = missing_definition_error()
+    ecs_client.register_task_definition.return_value = {}
+
+    environment = FargateTaskEnvironment(
+        family="test",
+        containerDefinitions=[
+            {
+                "environment": [
+                    {"name": "CUSTOM", "value": "custom"},
+                    {"name": "PREFECT__CLOUD__GRAPHQL", "value": "user"},
+                ]
+            }
+        ],
+    )
+
+    environment.setup(
+        Flow(
+            "name",
+            storage=Docker(registry_url="test", image_name="image", image_tag="tag"),
+        )
+    )
+
+    env_vars = ecs_client.register_task_definition.call_args[1]["containerDefinitions"][
+        0
+    ]["environment"]
+    names = [env_var["name"] for env_var in env_vars]
+    assert len(names) == len(set(names))
+    assert {"name": "CUSTOM", "value": "custom"} in env_vars
+    assert {
+        "name": "PREFECT__CLOUD__GRAPHQL",
+        "value": prefect.config.cloud.graphql,
+    } in env_vars
+
+
+def test_setup_skips_lookup_for_known_family(ecs_client):
+    ecs_client.describe_task_definition.side_effect = missing_definition_error()
+    ecs_client.register_task_definition.return_value = {}
+
+    environment = FargateTaskEnvironment(family="test")
+    flow = Flow(
+        "name",
+        storage=Docker(registry_url="test", image_name="image", image_tag="tag"),
+    )
+
+    environment.setup(flow)
+    environment.setup(flow)
+    FargateTaskEnvironment(family="test").setup(flow)
+
+    assert ecs_client.describe_task_definition.call_count == 1
+    assert ecs_client.register_task_definition.call_count == 1
+
+    FargateTaskEnvironment(family="test", region_name="other").setup(flow)
+
+    assert ecs_client.describe_task_definition.call_count == 2
+
+
+def test_setup_definition_register_no_defintions(ecs_client):
+    ecs_client.describe_task_definition.side_effect = missing_definition_error()
+    ecs_client.register_task_definition.return_value = {}
 
     environment = FargateTaskEnvironment(family="test")
 
@@ -312,12 +476,10 @@ def test_setup_definition_register_no_defintions(monkeypatch):
         )
     )
 
-    assert boto3_client.describe_task_definition.called
-    assert boto3_client.register_task_definition.called
-    assert boto3_client.register_task_definition.call_args[1]["family"] == "test"
-    assert boto3_client.register_task_definition.call_args[1][
-        "containerDefinitions"
-    ] == [
+    assert ecs_client.describe_task_definition.called
+    assert ecs_client.register_task_definition.called
+    assert ecs_client.register_task_definition.call_args[1]["family"] == "test"
+    assert ecs_client.register_task_definition.call_args[1]["containerDefinitions"] == [
         {
             "environment": [
                 {
@@ -347,10 +509,8 @@ def test_setup_definition_register_no_defintions(monkeypatch):
     ]
 
 
-def test_execute_run_task(monkeypatch):
-    boto3_client = MagicMock()
-    boto3_client.run_task.return_value = {}
-    monkeypatch.setattr("boto3.client", MagicMock(return_value=boto3_client))
+def test_execute_run_task(ecs_client):
+    ecs_client.run_task.return_value = {}
 
     with set_temporary_config({"cloud.auth_token": "test"}):
         environment = FargateTaskEnvironment(
@@ -366,9 +526,9 @@ def test_execute_run_task(monkeypatch):
             ),
         )
 
-        assert boto3_client.run_task.called
-        assert boto3_client.run_task.call_args[1]["taskDefinition"] == "test"
-        assert boto3_client.run_task.call_args[1]["overrides"] == {
+        assert ecs_client.run_task.called
+        assert ecs_client.run_task.call_args[1]["taskDefinition"] == "test"
+        assert ecs_client.run_task.call_args[1]["overrides"] == {
             "containerOverrides": [
                 {
                     "name": "flow-container",
@@ -383,14 +543,12 @@ def test_execute_run_task(monkeypatch):
                 }
             ]
         }
-        assert boto3_client.run_task.call_args[1]["launchType"] == "FARGATE"
-        assert boto3_client.run_task.call_args[1]["cluster"] == "test"
+        assert ecs_client.run_task.call_args[1]["launchType"] == "FARGATE"
+        assert ecs_client.run_task.call_args[1]["cluster"] == "test"
 
 
-def test_execute_run_task_agent_token(monkeypatch):
-    boto3_client = MagicMock()
-    boto3_client.run_task.return_value = {}
-    monkeypatch.setattr("boto3.client", MagicMock(return_value=boto3_client))
+def test_execute_run_task_agent_token(ecs_client):
+    ecs_client.run_task.return_value = {}
 
     with set_temporary_config({"cloud.agent.auth_token": "test"}):
         environment = FargateTaskEnvironment(
@@ -406,9 +564,9 @@ def test_execute_run_task_agent_token(monkeypatch):
             ),
         )
 
-        assert boto3_client.run_task.called
-        assert boto3_client.run_task.call_args[1]["taskDefinition"] == "test"
-        assert boto3_client.run_task.call_args[1]["overrides"] == {
+        assert ecs_client.run_task.called
+        assert ecs_client.run_task.call_args[1]["taskDefinition"] == "test"
+        assert ecs_client.run_task.call_args[1]["overrides"] == {
             "containerOverrides": [
                 {
                     "name": "flow-container",
@@ -423,8 +581,8 @@ def test_execute_run_task_agent_token(monkeypatch):
                 }
             ]
         }
-        assert boto3_client.run_task.call_args[1]["launchType"] == "FARGATE"
-        assert boto3_client.run_task.call_args[1]["cluster"] == "test"
+        assert ecs_client.run_task.call_args[1]["launchType"] == "FARGATE"
+        assert ecs_client.run_task.call_args[1]["cluster"] == "test"
 
 
 def test_run_flow(monkeypatch, tmpdir):
@@ -514,12 +672,10 @@ def test_run_flow_calls_callbacks(monkeypatch, tmpdir):
     assert exit_func.called
 
 
-def test_entire_environment_process_together(monkeypatch, tmpdir):
-    boto3_client = MagicMock()
-    boto3_client.describe_task_definition.side_effect = ClientError({}, None)
-    boto3_client.register_task_definition.return_value = {}
-    boto3_client.run_task.return_value = {}
-    monkeypatch.setattr("boto3.client", MagicMock(return_value=boto3_client))
+def test_entire_environment_process_together(ecs_client, monkeypatch, tmpdir):
+    ecs_client.describe_task_definition.side_effect = missing_definition_error()
+    ecs_client.register_task_definition.return_value = {}
+    ecs_client.run_task.return_value = {}
 
     flow_runner = MagicMock()
     monkeypatch.setattr(
@@ -559,10 +715,10 @@ def test_entire_environment_process_together(monkeypatch, tmpdir):
 
         environment.setup(flow=flow)
 
-        assert boto3_client.describe_task_definition.called
-        assert boto3_client.register_task_definition.called
-        assert boto3_client.register_task_definition.call_args[1]["family"] == "test"
-        assert boto3_client.register_task_definition.call_args[1][
+        assert ecs_client.describe_task_definition.called
+        assert ecs_client.register_task_definition.called
+        assert ecs_client.register_task_definition.call_args[1]["family"] == "test"
+        assert ecs_client.register_task_definition.call_args[1][
             "containerDefinitions"
         ] == [
             {
@@ -599,9 +755,9 @@ def test_entire_environment_process_together(monkeypatch, tmpdir):
 
         environment.execute(flow=flow)
 
-        assert boto3_client.run_task.called
-        assert boto3_client.run_task.call_args[1]["taskDefinition"] == "test"
-        assert boto3_client.run_task.call_args[1]["overrides"] == {
+        assert ecs_client.run_task.called
+        assert ecs_client.run_task.call_args[1]["taskDefinition"] == "test"
+        assert ecs_client.run_task.call_args[1]["overrides"] == {
             "containerOverrides": [
                 {
                     "name": "flow-container",
@@ -616,8 +772,8 @@ def test_entire_environment_process_together(monkeypatch, tmpdir):
                 }
             ]
         }
-        assert boto3_client.run_task.call_args[1]["launchType"] == "FARGATE"
-        assert boto3_client.run_task.call_args[1]["cluster"] == "test"
+        assert ecs_client.run_task.call_args[1]["launchType"] == "FARGATE"
+        assert ecs_client.run_task.call_args[1]["cluster"] == "test"
 
         d = Local(str(tmpdir))
         d.add_flow(prefect.Flow("name"))